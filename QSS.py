@@ -1,6 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from kerrlib import P_loss, P_no_loss, gaussian, rect, sech, lorentzian, myfft
+from kerrlib import P_loss, P_no_loss, P_gpu, gaussian, rect, sech, lorentzian, myfft
 
 
 class qss:
@@ -25,7 +25,8 @@ class qss:
         self.dk = self.kk[1] - self.kk[0]
 
     def evolution(self, L, G, T0, P0, ng, b2, g,
-                  u=None, loss=False, TN=None, TD=None, scale_factor=10**10):
+                  u=None, loss=False, TN=None, TD=None, scale_factor=10**10,
+                  use_gpu=False):
         r"""Evolves mean field through nonlinear channel waveguide, returning evolved field as well
           as N and M moments.
 
@@ -43,6 +44,7 @@ class qss:
             loss (bool): Toggle for lossless vs lossy evolution.
             TN (float): Nonlinear time [s*10^-10]. Derived parameter unless specified here.
             TD (float): Diserpsion time [s*10^-10]. Derived parameter unless specified here.
+            use_gpu (bool): Run the propagation on the GPU via CuPy (requires cupy).
 
         Returns:
             u (float(n)): Evolved mean field.
@@ -82,15 +84,18 @@ class qss:
         # number of points in time (final time=dt*tf)
         self.tf = np.rint(L / (v * self.dt) * scale_factor).astype(int)
 
-        # Set up k-space grid
-        xx, yy = np.meshgrid(self.ks, self.ks) / self.dk
-        im = np.rint(xx - yy) + (self.n - 1) / 2
-        ip = np.rint(xx + yy) + (self.n - 1) / 2
-        im = np.clip(im, 0, self.n - 1).astype(int)
-        ip = np.clip(ip, 0, self.n - 1).astype(int)
+        # Set up k-space grid: on the uniform shifted grid (n odd)
+        # ks[i]/dk = i - (n-1)/2, so the index matrices reduce to integer
+        # arithmetic with no float rounding at all
+        idx = np.arange(self.n)
+        im = np.clip(idx[None, :] - idx[:, None] + (self.n - 1) // 2, 0, self.n - 1)
+        ip = np.clip(idx[None, :] + idx[:, None] - (self.n - 1) // 2, 0, self.n - 1)
 
         # Perform Evolution
-        if not loss:
+        if use_gpu:
+            u, M, N = P_gpu(u, TD, TN, G, self.dz, self.kk, self.ks,
+                            self.dk, im, ip, self.tf, self.dt, self.n, loss=loss)
+        elif not loss:
             u, M, N = P_no_loss(u, TD, TN, self.dz, self.kk, self.ks,
                                 self.dk, im, ip, self.tf, self.dt, self.n)
         else:
@@ -145,13 +150,13 @@ class qss:
         f = myfft(u_ev, self.dz)
         f /= np.linalg.norm(f)
 
-        p1 = f.conj() @ M @ f.conj().T
-        p2 = f @ N @ f.conj().T
-
-        q1 = np.exp(2j * np.linspace(0, np.pi, 100)) * p1
-        q2 = p2
-        tp = q1 + q1.conj() + 2 * q2 + 1
-        sq = 10 * np.log10(tp.real)
+        # The quadratic forms reduce to scalars for a 1D local oscillator f
+        # (the old .T was a no-op), so the phase sweep is one real trig pass:
+        # exp(2j*phi)*p1 + c.c. = 2*(cos(2*phi)*Re(p1) - sin(2*phi)*Im(p1))
+        p1 = f.conj() @ (M @ f.conj())
+        p2 = (f @ (N @ f.conj())).real
+        sq = 10 * np.log10(2 * np.cos(2 * phi) * p1.real
+                           - 2 * np.sin(2 * phi) * p1.imag + 2 * p2 + 1)
         return phi, sq
 
     def plot_squeezing(self, phi, sq):
@@ -19,8 +19,20 @@ and insensitive moments in a (linearized) Kerr medium and some extra utility fun
 """
 
 
+import os
+
 import numpy as np
-from scipy.linalg import expm
+from numba import njit, prange
+
+try:
+    import pyfftw
+except ImportError:
+    pyfftw = None
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
 
 
 # Pulse Shapes
@@ -50,17 +62,17 @@ def sech(z):
 
 
 def rect(z, w=2 * np.sqrt(2 * np.log(2))):
-    r"""Returns a Gaussian function in z
+    r"""Returns a top hat function in z
 
     Args:
         z (array): Input values
-        l (array): Width of the top hat function
+        w (float): Width of the top hat function
 
     Returns:
         (array): Output array, element-wise top hat function of z. This is a scalar if x is a
         scalar.
     """
-    return np.where(abs(z) <= 0.5 * w, 1, 0)
+    return (np.abs(z) <= 0.5 * w).astype(np.float64)
 
 
 def lorentzian(z):
@@ -83,17 +95,97 @@ def FWHM(X, Y):
         X (array): Abscissae in which the function f( ) was sampled
         Y (array): Ordinate values, Y=f(X)
 
+    Assumes Y is unimodal (as for the pulse shapes used here), so the half
+    maximum is crossed exactly once on each side of the peak and the crossings
+    can be found by bisection on the rising and falling halves rather than by
+    scanning for sign changes over the full array.
+
     Returns:
         (float): FWHM of the function Y=f(X)
     """
+    Y = np.asarray(Y)
     half_max = np.max(Y) / 2.0
-    d = np.sign(half_max - np.array(Y[0:-1])) - np.sign(half_max - np.array(Y[1:]))
-    left_idx = np.where(d > 0)[0]
-    right_idx = np.where(d < 0)[-1]
+    imax = np.argmax(Y)
+    left_idx = np.searchsorted(Y[:imax + 1], half_max)
+    right_idx = imax + np.searchsorted(-Y[imax:], -half_max)
     return X[right_idx] - X[left_idx]
 
 
 # Fourier Transform Functions
+_fftw_plans = {}
+
+
+def _fftw_plan(n, direction):
+    r""" Returns a cached FFTW plan and its input buffer for length-n transforms
+
+    Plans are built once per (n, direction) with FFTW_MEASURE and reused for
+    every subsequent transform, so the twiddle schedule is not re-derived on
+    each call and all available cores are used.
+
+     Args:
+        n (int): Transform length
+        direction (str): Either "FFTW_FORWARD" or "FFTW_BACKWARD"
+
+    Returns:
+        (tuple): (plan, input buffer) for the requested transform
+    """
+    key = (n, direction)
+    if key not in _fftw_plans:
+        a = pyfftw.empty_aligned(n, dtype="complex128")
+        b = pyfftw.empty_aligned(n, dtype="complex128")
+        plan = pyfftw.FFTW(a, b, direction=direction,
+                           flags=("FFTW_MEASURE", "FFTW_DESTROY_INPUT"),
+                           threads=os.cpu_count())
+        _fftw_plans[key] = (plan, a)
+    return _fftw_plans[key]
+
+
+def _rfftw_plan(n):
+    r""" Returns a cached FFTW real-to-complex plan and its input buffer
+
+     Args:
+        n (int): Transform length
+
+    Returns:
+        (tuple): (plan, input buffer) for the requested transform
+    """
+    key = (n, "FFTW_REAL")
+    if key not in _fftw_plans:
+        a = pyfftw.empty_aligned(n, dtype="float64")
+        b = pyfftw.empty_aligned(n // 2 + 1, dtype="complex128")
+        plan = pyfftw.FFTW(a, b, flags=("FFTW_MEASURE", "FFTW_DESTROY_INPUT"),
+                           threads=os.cpu_count())
+        _fftw_plans[key] = (plan, a)
+    return _fftw_plans[key]
+
+
+def _myfft_real(x, dz):
+    r""" Numerical fourier transform of a real-valued x=f(t), as in :func:`myfft`
+
+    A real-to-complex transform computes the non-redundant half spectrum at
+    half the work of a full complex FFT; the remainder is reconstructed from
+    Hermitian symmetry F[n-k] = F[k]*.
+
+     Args:
+        x (array): The real-valued function evaluated on a real space grid of points
+        dz (float): The spacing between the grid points
+
+    Returns:
+        (array): The fourier transform of x=f(t)
+    """
+    n = len(x)
+    if pyfftw is None:
+        half = np.fft.rfft(x)
+    else:
+        plan, a = _rfftw_plan(n)
+        a[:] = x
+        half = plan()
+    full = np.empty(n, dtype=np.complex128)
+    full[:n // 2 + 1] = half
+    full[n // 2 + 1:] = half[1:(n + 1) // 2][::-1].conj()
+    return np.fft.fftshift(full) * (dz / np.sqrt(2.0 * np.pi))
+
+
 def myfft(z, dz):
     r""" Numerical fourier transform of z=f(t) with t sampled at intervals dz
 
@@ -104,7 +196,11 @@ def myfft(z, dz):
     Returns:
         (array): The fourier transform of z=f(t)
     """
-    return np.fft.fftshift(np.fft.fft(z) * dz / np.sqrt(2.0 * np.pi))
+    if pyfftw is None:
+        return np.fft.fftshift(np.fft.fft(z) * dz / np.sqrt(2.0 * np.pi))
+    plan, a = _fftw_plan(len(z), "FFTW_FORWARD")
+    a[:] = z
+    return np.fft.fftshift(plan()) * (dz / np.sqrt(2.0 * np.pi))
 
 
 def myifft(k, dk, n):
@@ -119,10 +215,48 @@ def myifft(k, dk, n):
     Returns:
         (array): The fourier transform of z=f(t)
     """
-    return np.fft.ifftshift(np.fft.ifft(k) * dk * n / np.sqrt(2.0 * np.pi))
+    if pyfftw is None:
+        return np.fft.ifftshift(np.fft.ifft(k) * dk * n / np.sqrt(2.0 * np.pi))
+    plan, a = _fftw_plan(len(k), "FFTW_BACKWARD")
+    a[:] = k
+    return np.fft.ifftshift(plan()) * (dk * n / np.sqrt(2.0 * np.pi))
 
 
 # Split-Step Fourier Operators For Mean-Field Evolution
+@njit(cache=True, fastmath=True)
+def _expD_half(TD, G, kk, dt):
+    r"""Precomputes the half-step dispersion and loss propagator in reciprocal space.
+
+    Args:
+        TD (float): Dispersion time
+        G (float): Loss rate
+        kk (array): Grid of reciprocal space points with DC point at start
+        dt (float): Size of time steps
+
+    Returns:
+        (array): The propagator exp(dt/2*(1j*kk**2/(2*TD) - G/2)), reusable across
+        all time steps since TD, G, kk and dt are fixed during a propagation.
+    """
+    return np.exp(dt / 2.0 * (1j * kk ** 2 / (2.0 * TD) - G / 2.0))
+
+
+@njit(cache=True, fastmath=True)
+def _opD_pre(u, expD_half):
+    r"""Applies a precomputed half-step dispersion propagator to u.
+
+    Args:
+        u (array): The function evaluated on a real space grid of points
+        expD_half (array): Precomputed propagator from :func:`_expD_half`
+
+    Returns:
+        (array): The propagated array u by amount dt/2
+    """
+    k = np.fft.fft(u)
+    k *= expD_half
+    return np.fft.ifft(k)
+
+
+@njit(cache=True, fastmath=True)
 def opD(u, TD, G, kk, dt):
     r"""Short time "kinetic" or "dispersive" propagator. It applies exp(1j dt*(1/2*TD) d^2/dx^2) to
     u(x). The differential operator is applied as multiplication in reciprocal space using fast
@@ -139,12 +273,10 @@ def opD(u, TD, G, kk, dt):
         (array): The propagated array u by amount dt/2 (note the factor of 1/2)
 
     """
-    k = np.fft.fft(u)
-    return np.fft.ifft(np.exp(dt / 2.0 * (1j * kk ** 2 / (2.0 * TD))) * k) * np.exp(
-        dt / 2.0 * (-G / 2.0)
-    )
+    return _opD_pre(u, _expD_half(TD, G, kk, dt))
 
 
+@njit(cache=True, fastmath=True)
 def opN(u, TN, ui, dt):
     r"""Short time "potential" or "nonlinear" propagator. It applies exp(1j dt*(TN) |ui(x)|^2) to
     u(x).
@@ -159,10 +291,49 @@ def opN(u, TN, ui, dt):
         (array): The propagated array u by amount dt
 
     """
-    return np.exp(dt * 1j / TN * np.abs(ui) ** 2) * u
+    out = np.empty(u.shape[0], dtype=np.complex128)
+    c = dt / TN
+    for i in range(u.shape[0]):
+        a = ui[i]
+        phase = c * (a.real * a.real + a.imag * a.imag)
+        out[i] = u[i] * complex(np.cos(phase), np.sin(phase))
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def _split_step(u, TN, expD_half, dt):
+    r"""Advances the mean field u by a single symmetrized split step dt.
+
+    Applies the sequence opD-opN-opD in one compiled call so that the FFT,
+    exponential and multiply pipeline runs entirely in nopython mode. The
+    dispersion propagator is precomputed once per propagation (see
+    :func:`_expD_half`) rather than re-evaluated every half step.
+
+    Args:
+        u (array): The function evaluated on a real space grid of points
+        TN (float): Nonlinear time
+        expD_half (array): Precomputed propagator from :func:`_expD_half`
+        dt (float): Size of time steps
+
+    Returns:
+        (array): The propagated array u by amount dt
+    """
+    ui = u
+    k = np.fft.fft(u)
+    k *= expD_half
+    u = np.fft.ifft(k)
+    c = dt / TN
+    for i in range(u.shape[0]):
+        a = ui[i]
+        phase = c * (a.real * a.real + a.imag * a.imag)
+        u[i] *= complex(np.cos(phase), np.sin(phase))
+    k = np.fft.fft(u)
+    k *= expD_half
+    return np.fft.ifft(k)
 
 
 # Mean-Field Evolution
+@njit(cache=True, fastmath=True)
 def P_mean_field(u, TD, TN, G, zz, dz, kk, N, dt):
     r"""Propagates the wavefunction u by time N*dt under both dispersion and nonlinearity.
 
@@ -180,11 +351,9 @@ def P_mean_field(u, TD, TN, G, zz, dz, kk, N, dt):
     Returns:
         (array): The time evolved wavefunction after N*dt time.
     """
+    expD_half = _expD_half(TD, G, kk, dt)
     for _ in range(N):
-        ui = u
-        u = opD(u, TD, G, kk, dt)
-        u = opN(u, TN, ui, dt)
-        u = opD(u, TD, G, kk, dt)
+        u = _split_step(u, TN, expD_half, dt)
     return u
 
 
@@ -212,7 +381,33 @@ def cal_M(u, TN, dz):
     Returns:
         (array): cal_M array
     """
-    return myfft(np.abs(u) ** 2, dz) / TN
+    return _myfft_real(np.abs(u) ** 2, dz) / TN
+
+
+def _R_into(out, abs_u2, TN, dz, ks2_2TD, dk, im, n):
+    r""" Writes the R matrix for fluctuation propagation into a preallocated buffer
+
+    Args:
+        out (array(n,n)): Complex buffer receiving the R matrix
+        abs_u2 (array): Squared modulus |u|**2 of the mean field, precomputed by
+          the caller so a single elementwise pass can be shared with S
+        TN (float): Nonlinear time
+        dz (float): Size of discretization in real space
+        ks2_2TD (array): Dispersion diagonal ks**2/(2*TD), precomputed by the
+          caller since ks and TD are fixed during a propagation
+        dk (float): Size of discretization in reciprocal space
+        im (int(n,n)): 2D array of integers (i,j) corresponding to the k-space gridpoints associated
+          with i-j (clipped to be between 0 and n-1 so as not to fall off the grid).
+        n (int): Size of the output matrix R
+
+    Returns:
+        (array): The buffer out, filled with the R matrix
+    """
+    Mk = _myfft_real(abs_u2, dz) / TN
+    np.take(Mk, im, out=out)
+    out *= 2.0 * dk / np.sqrt(2.0 * np.pi)
+    out.flat[::n + 1] += ks2_2TD
+    return out
 
 
 def R(u, TD, TN, dz, ks, dk, im, n):
@@ -231,9 +426,30 @@ def R(u, TD, TN, dz, ks, dk, im, n):
     Returns:
         (array): R matrix
     """
-    Mk = cal_M(u, TN, dz)
-    D = np.diag(np.full(n, ks ** 2 / (2.0 * TD)))
-    return D + 2.0 * dk * Mk[im] / np.sqrt(2.0 * np.pi)
+    abs_u2 = u.real * u.real + u.imag * u.imag
+    ks2_2TD = ks * ks * (0.5 / TD)
+    return _R_into(np.empty((n, n), dtype=np.complex128), abs_u2, TN, dz, ks2_2TD, dk, im, n)
+
+
+def _S_into(out, u_sq, TN, dz, dk, ip):
+    r""" Writes the S matrix for fluctuation propagation into a preallocated buffer
+
+    Args:
+        out (array(n,n)): Complex buffer receiving the S matrix
+        u_sq (array): Square u**2 of the mean field, precomputed by the caller
+        TN (float): Nonlinear time
+        dz (float): Size of discretization in real space
+        dk (float): Size of discretization in reciprocal space
+        ip (int(n,n)): 2D array of integers (i,j) corresponding to the k-space gridpoints associated
+          with i+j (clipped to be between 0 and n-1 so as not to fall off the grid).
+
+    Returns:
+        (array): The buffer out, filled with the S matrix
+    """
+    Sk = myfft(u_sq, dz) / TN
+    np.take(Sk, ip, out=out)
+    out *= dk / np.sqrt(2.0 * np.pi)
+    return out
 
 
 def S(u, TN, dz, dk, ip):
@@ -250,8 +466,8 @@ def S(u, TN, dz, dk, ip):
     Returns:
         (array): S matrix
     """
-    Sk = cal_S(u, TN, dz)
-    return dk * Sk[ip] / np.sqrt(2.0 * np.pi)
+    n = ip.shape[0]
+    return _S_into(np.empty((n, n), dtype=np.complex128), u * u, TN, dz, dk, ip)
 
 
 def Q(u, TD, TN, dz, ks, dk, im, ip, n):
@@ -275,7 +491,153 @@ def Q(u, TD, TN, dz, ks, dk, im, ip, n):
     """
     r = R(u, TD, TN, dz, ks, dk, im, n)
     s = S(u, TN, dz, dk, ip)
-    return np.block([[r, s], [-s.conj().T, -r.conj()]])
+    out = np.empty((2 * n, 2 * n), dtype=np.complex128)
+    out[:n, :n] = r
+    out[:n, n:] = s
+    np.conjugate(s.T, out=out[n:, :n])
+    out[n:, :n] *= -1
+    np.conjugate(r, out=out[n:, n:])
+    out[n:, n:] *= -1
+    return out
+
+
+# Matrix Exponential For Fluctuation Propagation
+@njit(cache=True)
+def _expm(A):
+    r"""Matrix exponential of A by Pade-13 approximation with scaling and squaring.
+
+    Q is pseudo-Hermitian rather than Hermitian (sigma_z Q sigma_z = Q^dag), so
+    a Hermitian eigendecomposition of 1j*dt*Q is not available; instead the
+    standard Higham scaling-and-squaring algorithm is used, with the exact
+    1-norm of A in place of scipy's norm-estimation machinery so the whole
+    routine is jit-compilable. The Pade degree is picked from the norm using
+    Higham's theta thresholds: for the small generator norms of weakly
+    dispersive steps (norm*dt well below 1) this needs as few as 2 GEMMs and
+    no squaring, while large-norm generators fall back to degree 13 with
+    scaling and squaring.
+
+    Args:
+        A (array(m,m)): Matrix to exponentiate
+
+    Returns:
+        (array(m,m)): The matrix exponential of A
+    """
+    m = A.shape[0]
+    norm = 0.0
+    for j in range(m):
+        c = 0.0
+        for i in range(m):
+            c += abs(A[i, j])
+        if c > norm:
+            norm = c
+    ident = np.eye(m).astype(A.dtype)
+    if norm <= 2.097847961257068:
+        A2 = A @ A
+        if norm <= 1.495585217958292e-2:
+            U = A @ (A2 + 60.0 * ident)
+            V = 12.0 * A2 + 120.0 * ident
+        elif norm <= 2.539398330063230e-1:
+            A4 = A2 @ A2
+            U = A @ (A4 + 420.0 * A2 + 15120.0 * ident)
+            V = 30.0 * A4 + 3360.0 * A2 + 30240.0 * ident
+        elif norm <= 9.504178996162932e-1:
+            A4 = A2 @ A2
+            A6 = A2 @ A4
+            U = A @ (A6 + 1512.0 * A4 + 277200.0 * A2 + 8648640.0 * ident)
+            V = 56.0 * A6 + 25200.0 * A4 + 1995840.0 * A2 + 17297280.0 * ident
+        else:
+            A4 = A2 @ A2
+            A6 = A2 @ A4
+            A8 = A4 @ A4
+            U = A @ (A8 + 3960.0 * A6 + 2162160.0 * A4
+                     + 302702400.0 * A2 + 8821612800.0 * ident)
+            V = (90.0 * A8 + 110880.0 * A6 + 30270240.0 * A4
+                 + 2075673600.0 * A2 + 17643225600.0 * ident)
+        return np.linalg.solve(V - U, V + U)
+    b = np.array([64764752532480000.0, 32382376266240000.0, 7771770303897600.0,
+                  1187353796428800.0, 129060195264000.0, 10559470521600.0,
+                  670442572800.0, 33522128640.0, 1323241920.0, 40840800.0,
+                  960960.0, 16380.0, 182.0, 1.0])
+    theta13 = 5.371920351148152
+    s = max(0, int(np.ceil(np.log2(norm / theta13))))
+    As = A / (2.0 ** s)
+    A2 = As @ As
+    A4 = A2 @ A2
+    A6 = A2 @ A4
+    U = As @ (A6 @ (b[13] * A6 + b[11] * A4 + b[9] * A2)
+              + b[7] * A6 + b[5] * A4 + b[3] * A2 + b[1] * ident)
+    V = (A6 @ (b[12] * A6 + b[10] * A4 + b[8] * A2)
+         + b[6] * A6 + b[4] * A4 + b[2] * A2 + b[0] * ident)
+    R = np.ascontiguousarray(np.linalg.solve(V - U, V + U))
+    for _ in range(s):
+        R = R @ R
+    return R
+
+
+@njit(cache=True)
+def _bogo_expm(X11, X12):
+    r"""Exponential of the Bogoliubov generator [[X11, X12], [X12*, X11*]].
+
+    1j*dt*Q has this block form (X11 = 1j*dt*R, X12 = 1j*dt*S), which is the
+    complex representation of an R-linear operator on C^n. Mapping it to its
+    real 2n x 2n matrix, exponentiating there, and mapping back is exact and
+    replaces the complex 2n x 2n exponential with a real one at a quarter of
+    the flops. The result is returned as the two independent n x n blocks
+    (U, W) of exp([[X11, X12], [X12*, X11*]]) = [[U, W], [W*, U*]].
+
+    Args:
+        X11 (array(n,n)): Upper-left block of the generator
+        X12 (array(n,n)): Upper-right block of the generator
+
+    Returns:
+        (tuple): (U, W), the upper blocks of the exponential
+    """
+    n = X11.shape[0]
+    Xr = np.empty((2 * n, 2 * n))
+    Xr[:n, :n] = X11.real + X12.real
+    Xr[:n, n:] = X12.imag - X11.imag
+    Xr[n:, :n] = X11.imag + X12.imag
+    Xr[n:, n:] = X11.real - X12.real
+    Kr = _expm(Xr)
+    U = 0.5 * ((Kr[:n, :n] + Kr[n:, n:]) + 1j * (Kr[n:, :n] - Kr[:n, n:]))
+    W = 0.5 * ((Kr[:n, :n] - Kr[n:, n:]) + 1j * (Kr[n:, :n] + Kr[:n, n:]))
+    return U, W
+
+
+@njit(cache=True, parallel=True)
+def _step_UW(Us, Ws, U, W):
+    r"""Applies the per-step Bogoliubov blocks (Us, Ws) to the accumulated (U, W).
+
+    Computes U <- Us U + Ws W* and W <- Us W + Ws U*. The four products go
+    through BLAS; the conjugate copies and the final additions are
+    memory-bound elementwise passes and are distributed across cores with
+    prange.
+
+    Args:
+        Us (array(n,n)): Per-step U block
+        Ws (array(n,n)): Per-step W block
+        U (array(n,n)): Accumulated U block
+        W (array(n,n)): Accumulated W block
+
+    Returns:
+        (tuple): (U, W), the updated accumulated blocks
+    """
+    n = U.shape[0]
+    Uc = np.empty_like(U)
+    Wc = np.empty_like(W)
+    for i in prange(n):
+        for j in range(n):
+            Uc[i, j] = np.conj(U[i, j])
+            Wc[i, j] = np.conj(W[i, j])
+    U_new = Us @ U
+    U_add = Ws @ Wc
+    W_new = Us @ W
+    W_add = Ws @ Uc
+    for i in prange(n):
+        for j in range(n):
+            U_new[i, j] += U_add[i, j]
+            W_new[i, j] += W_add[i, j]
+    return U_new, W_new
 
 
 # Lossless Propagation
@@ -301,17 +663,24 @@ def P_no_loss(u, TD, TN, dz, kk, ks, dk, im, ip, tf, dt, n):
     Returns:
         (tuple): (u,M,N), the first (u) and second order moments (M,N).
     """
-    M = np.zeros(n)
-    N = np.zeros(n)
-    K = np.identity(2 * n)
+    # The accumulated propagator always has the block form [[U, W], [W*, U*]],
+    # so only the two independent n x n blocks are stored and updated
+    U = np.identity(n, dtype=np.complex128)
+    W = np.zeros((n, n), dtype=np.complex128)
+    expD_half = _expD_half(TD, 0.0, kk, dt)
+    # Generator block scratch buffers, refilled in place every step
+    X11 = np.empty((n, n), dtype=np.complex128)
+    X12 = np.empty((n, n), dtype=np.complex128)
+    ks2_2TD = ks * ks * (0.5 / TD)
     for _ in range(tf):
-        ui = u
-        u = opD(u, TD, 0, kk, dt)
-        u = opN(u, TN, ui, dt)
-        u = opD(u, TD, 0, kk, dt)
-        K = expm(1j * dt * Q(u, TD, TN, dz, ks, dk, im, ip, n)) @ K
-    U = K[0:n, 0:n]
-    W = K[0:n, n:2 * n]
+        u = _split_step(u, TN, expD_half, dt)
+        abs_u2 = u.real * u.real + u.imag * u.imag
+        _R_into(X11, abs_u2, TN, dz, ks2_2TD, dk, im, n)
+        _S_into(X12, u * u, TN, dz, dk, ip)
+        X11 *= 1j * dt
+        X12 *= 1j * dt
+        Us, Ws = _bogo_expm(X11, X12)
+        U, W = _step_UW(Us, Ws, U, W)
     M = U @ W.T
     N = W.conj() @ W.T
     return u, M, N
@@ -343,14 +712,19 @@ def P_loss(u, TD, TN, G, dz, kk, ks, dk, im, ip, tf, dt, n):
     """
     M = np.zeros(n)
     N = np.zeros(n)
+    expD_half = _expD_half(TD, G, kk, dt)
+    # Generator block scratch buffers, refilled in place every step
+    X11 = np.empty((n, n), dtype=np.complex128)
+    X12 = np.empty((n, n), dtype=np.complex128)
+    ks2_2TD = ks * ks * (0.5 / TD)
     for _ in range(tf):
-        ui = u
-        u = opD(u, TD, G, kk, dt)
-        u = opN(u, TN, ui, dt)
-        u = opD(u, TD, G, kk, dt)
-        K = expm(1j * dt * Q(u, TD, TN, dz, ks, dk, im, ip, n))
-        U = K[0:n, 0:n]
-        W = K[0:n, n:2 * n]
+        u = _split_step(u, TN, expD_half, dt)
+        abs_u2 = u.real * u.real + u.imag * u.imag
+        _R_into(X11, abs_u2, TN, dz, ks2_2TD, dk, im, n)
+        _S_into(X12, u * u, TN, dz, dk, ip)
+        X11 *= 1j * dt
+        X12 *= 1j * dt
+        U, W = _bogo_expm(X11, X12)
         M = U @ M @ (U.T) + W @ (M.conj()) @ (W.T) + W @ N @ (U.T) + U @ (N.T) @ (W.T) + U @ (W.T)
 
         N = (
@@ -365,6 +739,124 @@ def P_loss(u, TD, TN, G, dz, kk, ks, dk, im, ip, tf, dt, n):
     return u, M, N
 
 
+# GPU Propagation
+def _bogo_expm_gpu(X11, X12):
+    r"""GPU counterpart of :func:`_bogo_expm` operating on CuPy arrays.
+
+    Uses the same real-representation trick, with the real 2n x 2n exponential
+    evaluated by cuSOLVER-backed cupyx.scipy.linalg.expm.
+
+    Args:
+        X11 (array(n,n)): Upper-left block of the generator (device array)
+        X12 (array(n,n)): Upper-right block of the generator (device array)
+
+    Returns:
+        (tuple): (U, W), the upper blocks of the exponential (device arrays)
+    """
+    from cupyx.scipy.linalg import expm as cp_expm
+
+    n = X11.shape[0]
+    Xr = cp.empty((2 * n, 2 * n))
+    Xr[:n, :n] = X11.real + X12.real
+    Xr[:n, n:] = X12.imag - X11.imag
+    Xr[n:, :n] = X11.imag + X12.imag
+    Xr[n:, n:] = X11.real - X12.real
+    Kr = cp_expm(Xr)
+    U = 0.5 * ((Kr[:n, :n] + Kr[n:, n:]) + 1j * (Kr[n:, :n] - Kr[:n, n:]))
+    W = 0.5 * ((Kr[:n, :n] - Kr[n:, n:]) + 1j * (Kr[n:, :n] + Kr[:n, n:]))
+    return U, W
+
+
+def P_gpu(u, TD, TN, G, dz, kk, ks, dk, im, ip, tf, dt, n, loss=False):
+    r""" GPU propagation of the mean and fluctuations in a Kerr medium via CuPy
+
+    Mirrors P_no_loss/P_loss step for step, but keeps the field, the index
+    gathers, the per-step exponential and all GEMMs on the device (cuFFT,
+    cuBLAS, cuSOLVER); only the final moments are copied back to the host.
+    Worthwhile for large n, where the per-step 2n x 2n exponential and the
+    n x n block products dominate.
+
+    Args:
+        u (array): Mean field values evaluated on a real space grid of points
+        TD (float): Dispersion time
+        TN (float): Nonlinear time
+        G (float): Loss rate (ignored unless loss=True)
+        dz (float): Size of discretization in real space
+        kk (array): Grid of reciprocal space points with DC point at start
+        ks (array): Grid of reciprocal space points with DC point at centre
+        dk (float): Size of discretization in reciprocal space
+        im (int(n,n)): 2D array of integers (i,j) corresponding to the k-space gridpoints associated
+          with i-j (clipped to be between 0 and n-1 so as not to fall off the grid).
+        ip (int(n,n)): 2D array of integers (i,j) corresponding to the k-space gridpoints associated
+          with i+j (clipped to be between 0 and n-1 so as not to fall off the grid).
+        tf (int): Number of time steps
+        dt (int): Size of time steps
+        n (int): Size of the output matrices
+        loss (bool): Toggle for lossless vs lossy evolution.
+
+    Returns:
+        (tuple): (u,M,N), the first (u) and second order moments (M,N), as host arrays.
+    """
+    if cp is None:
+        raise ImportError("CuPy is required for GPU propagation but is not installed.")
+
+    if not loss:
+        G = 0.0
+    u = cp.asarray(u, dtype=cp.complex128)
+    kk = cp.asarray(kk)
+    im = cp.asarray(im)
+    ip = cp.asarray(ip)
+    ks2_2TD = cp.asarray(ks * ks * (0.5 / TD))
+    expD_half = cp.exp(dt / 2.0 * (1j * kk ** 2 / (2.0 * TD) - G / 2.0))
+    diag = cp.arange(n)
+    scale = dz / np.sqrt(2.0 * np.pi) / TN
+
+    if not loss:
+        U = cp.identity(n, dtype=cp.complex128)
+        W = cp.zeros((n, n), dtype=cp.complex128)
+    else:
+        M = cp.zeros((n, n), dtype=cp.complex128)
+        N = cp.zeros((n, n), dtype=cp.complex128)
+
+    for _ in range(tf):
+        ui = u
+        k = cp.fft.fft(u)
+        k *= expD_half
+        u = cp.fft.ifft(k)
+        u = u * cp.exp(dt * 1j / TN * cp.abs(ui) ** 2)
+        k = cp.fft.fft(u)
+        k *= expD_half
+        u = cp.fft.ifft(k)
+
+        Mk = cp.fft.fftshift(cp.fft.fft(cp.abs(u) ** 2)) * scale
+        Sk = cp.fft.fftshift(cp.fft.fft(u * u)) * scale
+        X11 = (2.0 * dk / np.sqrt(2.0 * np.pi)) * Mk[im]
+        X11[diag, diag] += ks2_2TD
+        X11 *= 1j * dt
+        X12 = (1j * dt * dk / np.sqrt(2.0 * np.pi)) * Sk[ip]
+        Us, Ws = _bogo_expm_gpu(X11, X12)
+
+        if not loss:
+            U, W = Us @ U + Ws @ W.conj(), Us @ W + Ws @ U.conj()
+        else:
+            M = (Us @ M @ (Us.T) + Ws @ (M.conj()) @ (Ws.T) + Ws @ N @ (Us.T)
+                 + Us @ (N.T) @ (Ws.T) + Us @ (Ws.T))
+            N = (
+                Ws.conj() @ M @ (Us.T) +
+                Us.conj() @ (M.conj()) @ (Ws.T) +
+                Us.conj() @ N @ (Us.T) +
+                Ws.conj() @ (N.T) @ (Ws.T) +
+                Ws.conj() @ (Ws.T)
+            )
+            M = (1 - G * dt) * M
+            N = (1 - G * dt) * N
+
+    if not loss:
+        M = U @ W.T
+        N = W.conj() @ W.T
+    return cp.asnumpy(u), cp.asnumpy(M), cp.asnumpy(N)
+
+
 def expected_squeezing_g(n_phi):
     r"""Calculate expected squeezing for Gaussian pulse for lossless, dispersionless propagation,
     with a maximum nonlinear phase shift of n_phi according to JOSA B 7, 30 (1990).
@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 from scipy.signal import find_peaks
 from scipy.linalg import expm
-from kerrlib import gaussian, myfft, opD, opN, FWHM, R, S, Q, P_no_loss
+from kerrlib import gaussian, myfft, opD, opN, FWHM, R, S, Q, P_no_loss, _expm
 
 G = 0  # loss parameter
 
@@ -132,6 +132,20 @@ def test_Q_matrix():
     np.testing.assert_almost_equal(np.linalg.norm(Qtemp @ R - R @ Qtemp.conj().T), 0)
 
 
+def test_expm_degree_branches():
+    r"""Test _expm against scipy's expm at 1-norms exercising every Pade degree
+    branch, including the (theta9, theta13/2] window where degree 13 applies
+    but no squaring is required."""
+    rng = np.random.default_rng(42)
+    for target_norm in [0.01, 0.2, 0.8, 1.9, 2.3, 2.6, 4.0, 40.0]:
+        A = rng.standard_normal((40, 40)) + 1j * rng.standard_normal((40, 40))
+        A *= target_norm / np.abs(A).sum(axis=0).max()
+        expected = expm(A)
+        found = _expm(A)
+        np.testing.assert_almost_equal(
+            np.linalg.norm(found - expected) / np.linalg.norm(expected), 0)
+
+
 def test_propagation_submatrices():
     r"""Test U and V matrices. Together they should satisfy UU^dag - WW^dag =I and UW^T = WU^T"""
     factor = 1